@@ -3,8 +3,9 @@ from __future__ import annotations
 import os
 import sys
 import logging
-from typing import TYPE_CHECKING, TextIO, Optional
+from typing import TYPE_CHECKING, Deque, Tuple, TextIO, Optional
 from pathlib import Path
+from collections import deque
 from logging.handlers import TimedRotatingFileHandler
 
 from PySide2.QtCore import Qt, Signal, QObject
@@ -51,23 +52,39 @@ class HandlerSignal(QObject):
 
 
 class WidgetLogHandler(logging.Handler):
+    """Send the log lines to a `TasksLog` widget.
 
-    def __init__(self, widget: TasksLog, debug: bool = False) -> None:
+    Lines emitted before the widget is set are buffered (up to `max_lines`, 0 means
+    unlimited) and replayed when `set_widget` is called.
+    """
+
+    def __init__(self, debug: bool = False, max_lines: int = 0) -> None:
         super().__init__()
         self.set_name('widget_handler')
         self.setLevel(logging.DEBUG if debug else logging.INFO)
         self.setFormatter(LOG_WIDGET_FORMAT)
 
-        self._widget = widget
+        self._widget: Optional[TasksLog] = None
+        self._buffer: Deque[Tuple[str, str, str]] = deque(maxlen=max_lines or None)
         self._signal = HandlerSignal()
-        self._signal.log_message.connect(self._widget.log, Qt.QueuedConnection)
+
+    def set_widget(self, widget: TasksLog) -> None:
+        # hold the handler lock so no line can slip between the replay and the switch
+        with self.lock:
+            self._widget = widget
+            self._signal.log_message.connect(widget.log, Qt.QueuedConnection)
+
+            for line in self._buffer:
+                self._signal.log_message.emit(*line)
+            self._buffer.clear()
 
     def emit(self, record: logging.LogRecord) -> None:
-        self._signal.log_message.emit(
-            self.format(record) + '\n',
-            record.levelname.upper(),
-            str(record.thread)
-        )
+        line = (self.format(record) + '\n', record.levelname.upper(), str(record.thread))
+
+        if self._widget is None:
+            self._buffer.append(line)
+        else:
+            self._signal.log_message.emit(*line)
 
 
 def log_file_handler(config_path: Path) -> TimedRotatingFileHandler:
@@ -77,7 +94,8 @@ def log_file_handler(config_path: Path) -> TimedRotatingFileHandler:
     handler = TimedRotatingFileHandler(
         filename=tqm_log_dir / 'tqm.log',
         when='midnight',
-        backupCount=7
+        backupCount=7,
+        delay=True
     )
 
     handler.setLevel(logging.DEBUG)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import sys
 import json
+import threading
 from typing import Any, Dict, Literal, Optional, Generator
 from pathlib import Path
 from contextlib import contextmanager
@@ -76,9 +77,30 @@ class Settings(metaclass=_SingletonMeta):
     max_workers: int = 20
     enable_debug: bool = False
     wrap_lines: bool = True
+    max_log_lines: int = 10000
     view: Dict[str, Any] = field(default_factory=dict[str, Any], repr=False)
 
 
+# settings can be written from worker threads
+_SETTINGS_LOCK = threading.RLock()
+
+
+def _load_settings(json_file_path: Path) -> Settings:
+    try:
+        with json_file_path.open() as f:
+            return Settings(**json.load(f))
+
+    except FileNotFoundError:
+        settings = Settings()
+        with json_file_path.open('w') as f:
+            json.dump(asdict(settings), f, indent=4)
+        return settings
+
+    except Exception as e:
+        print('[tqm error]: Invalid settings file. Resetting settings.', e)
+        return Settings()
+
+
 @contextmanager
 def open_settings(
     mode: Literal['r', 'w'] = 'r',
@@ -95,23 +117,18 @@ def open_settings(
     if json_file_path is None:
         json_file_path = Path(os.environ['TQM_SETTINGS_PATH'])
 
-    try:
-        with json_file_path.open() as f:
-            settings = Settings(**json.load(f))
-
-    except FileNotFoundError:
-        settings = Settings()
-        with json_file_path.open('w') as f:
-            json.dump(asdict(settings), f, indent=4)
-
-    except Exception as e:
-        print('[tqm error]: Invalid settings file. Resetting settings.', e)
-        settings = Settings()
-
-    yield settings
-
     if mode != 'w':
+        with _SETTINGS_LOCK:
+            settings = _load_settings(json_file_path)
+        yield settings
         return
 
-    with json_file_path.open('w') as f:
-        json.dump(asdict(settings), f, indent=4)
+    # a write rewrites the whole file, so the lock is held until the caller is done
+    # with the settings: a writer releasing it in between could be overwritten by
+    # another writer that loaded the file before its changes were saved
+    with _SETTINGS_LOCK:
+        settings = _load_settings(json_file_path)
+        yield settings
+
+        with json_file_path.open('w') as f:
+            json.dump(asdict(settings), f, indent=4)
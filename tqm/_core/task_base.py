@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import uuid
-from typing import (TYPE_CHECKING, Any, Set, Dict, Tuple, Generic, TypeVar,
-                    Iterator, Optional, Generator)
+from typing import (TYPE_CHECKING, Any, Set, Dict, List, Tuple, Generic,
+                    TypeVar, Iterator, Optional, Generator)
 from itertools import count
 from dataclasses import field, dataclass
 
-from PySide2.QtGui import QColor
+from PySide2.QtGui import QColor, QStandardItem
 
 from .logger import LOGGER, USER_LEVEL
 from .task_state import TaskState
 from .task_runner import BaseRunner
 from .retry_policy import RetryPolicy, NoRetryPolicy
-from .task_actions import TaskAction
+from .task_actions import TaskAction, TaskActionVisibility
 from .task_options import ProgressBarOptions
 from .._ui.task_item import TaskItem
 from .task_callbacks import TaskCallbacks
@@ -51,6 +51,9 @@ class TaskBase(Generic[T, W]):
 
     # events
     actions: Tuple[TaskAction[T], ...] = field(default_factory=tuple, repr=False)
+    actions_by_visibility: Dict[TaskActionVisibility, Tuple[TaskAction[T], ...]] = field(
+        init=False, repr=False, default_factory=dict
+    )
     predicate: TaskPredicate = field(default_factory=TaskPredicate, repr=False)
     callbacks: TaskCallbacks[T] = field(default_factory=TaskCallbacks['T'], repr=False)
 
@@ -59,6 +62,7 @@ class TaskBase(Generic[T, W]):
     # UI
     color: QColor = QColor(220, 220, 220, 255)
     item: Optional[TaskItem] = field(init=False, repr=False, default=None)
+    row_items: List[QStandardItem] = field(init=False, repr=False, default_factory=list)
     progress_bar: ProgressBarOptions = field(default_factory=ProgressBarOptions, repr=False)
 
     # relationships
@@ -75,6 +79,11 @@ class TaskBase(Generic[T, W]):
 
         self.index = index_gen(suffix)
 
+        for visibility in TaskActionVisibility:
+            self.actions_by_visibility[visibility] = tuple(
+                action for action in self.actions if action.visibility == visibility
+            )
+
         if not self.name:
             self.name = f'{suffix}-{str(self.index).zfill(5)}'
 
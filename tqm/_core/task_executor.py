@@ -23,7 +23,9 @@ class _ExecutorCallbacks(RunnerSignals):
 
     # ui
     task_added = Signal(object)
+    tasks_added = Signal(list)
     task_removed = Signal(object)
+    task_retried = Signal(object)
     task_finished = Signal(object)
 
     status_updated = Signal(dict)
@@ -194,6 +196,11 @@ class _ExecutorStateTracker(QObject):
             'failed': 0,
         }
 
+        # tasks and groups currently in each tracked state
+        self._tasks_by_state: Dict[str, Set[TaskUnit]] = {
+            state: set() for state in self._state_counts
+        }
+
         self._idle_timer: Optional[QTimer] = None
         self._idle_timeout = int(os.getenv('TQM_IDLE_TIMEOUT', 1000))
 
@@ -201,6 +208,21 @@ class _ExecutorStateTracker(QObject):
     def running_tasks(self) -> int:
         return self._state_counts['running']
 
+    def get_tasks(self, state: str) -> Set[TaskUnit]:
+        """Return a copy of the tasks currently in the given state."""
+        return set(self._tasks_by_state[state])
+
+    def on_state_changed(self, task: TaskUnit, old_state: str, new_state: str) -> None:
+        if old_state in self._tasks_by_state:
+            self._tasks_by_state[old_state].discard(task)
+
+        if new_state in self._tasks_by_state:
+            self._tasks_by_state[new_state].add(task)
+
+        # the status only reports the executable tasks
+        if isinstance(task, TaskExecutable):
+            self.update_status(old_state, new_state)
+
     def update_status(self, old_state: str, new_state: str) -> None:
         if old_state in self._state_counts:
             self._state_counts[old_state] -= 1
@@ -349,6 +371,10 @@ class TaskExecutor(QObject):
             self.retry_task(task.group)
 
         self._initialize_task(task)
+
+        # the reset created a new runner, listeners reconnect before it can start
+        self.callbacks.task_retried.emit(task)
+
         self._start_worker()
 
     @Slot(object)
@@ -433,8 +459,9 @@ class TaskExecutor(QObject):
         if task in self.registry:
             raise TaskAlreadyInQueue(f'Task "{task}" already in queue')
 
-        if isinstance(task, TaskExecutable):
-            task.state.register_state_change_callback(self.status_tracker.update_status)
+        task.state.register_state_change_callback(
+            partial(self.status_tracker.on_state_changed, task)
+        )
 
         LOGGER.info('Adding task to queue: %s', task.name)
 
@@ -443,6 +470,23 @@ class TaskExecutor(QObject):
 
         return task
 
+    def add_tasks(self, tasks: List[TaskUnit]) -> List[TaskUnit]:
+        """Add multiple tasks to the queue.
+
+        All the tasks are validated first, so either every task is added or none is.
+
+        Raises:
+            TaskAlreadyInQueue: If a task is already in the queue or listed twice.
+
+        """
+        seen: Set[TaskUnit] = set()
+        for task in tasks:
+            if task in self.registry or task in seen:
+                raise TaskAlreadyInQueue(f'Task "{task}" already in queue')
+            seen.add(task)
+
+        return [self.add_task(task) for task in tasks]
+
     def _start_worker(self) -> None:
         task = self.queue.dequeue()
 
@@ -460,6 +504,18 @@ class TaskExecutor(QObject):
     def get_all_tasks(self) -> Set[TaskUnit]:
         return self.registry
 
+    def get_tasks_by_state(self, state: str) -> Set[TaskUnit]:
+        """Return the tasks currently in a tracked state.
+
+        Tracked states are: waiting, running, completed and failed.
+
+        ```
+        for task in executor.get_tasks_by_state('failed'):
+            executor.retry_task(task)
+        ```
+        """
+        return self.status_tracker.get_tasks(state)
+
     def shutdown(self) -> None:
         """Shutdown the task manager.
 
@@ -58,6 +58,10 @@ def format_duration(seconds: float) -> str:
     return f"+{hours}h {minutes}m"
 
 
+def _noop_state_changed(previous_state: str, state: str) -> None:
+    """Default state change callback."""
+
+
 @dataclass
 class StateHistory:
     active_state: str
@@ -78,7 +82,7 @@ class TaskState:
     history:  Tuple[StateHistory, ...] = field(default_factory=tuple)
 
     def __post_init__(self) -> None:
-        self._on_state_changed: Optional[Callable[[str, str], None]] = None
+        self._on_state_changed: Callable[[str, str], Any] = _noop_state_changed
 
     def __str__(self) -> str:
         return self.current.name.lower()
@@ -127,8 +131,7 @@ class TaskState:
         history = StateHistory(self.current.value, comment)
         self.history = self.history + (history,)
 
-        if self._on_state_changed:
-            self._on_state_changed(previous_state, state)
+        self._on_state_changed(previous_state.value, state.value)
 
     def register_state_change_callback(
         self,
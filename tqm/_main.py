@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import os
 from typing import Any, Callable, Optional, Generator
+from functools import cached_property
 from contextlib import contextmanager
 
+from PySide2.QtGui import QCloseEvent
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QWidget, QSplitter, QMainWindow, QMessageBox
 
+from .widgets import LazyWidget
 from ._core.task import TaskUnit, TaskGroup, TaskExecutable
 from ._core.logger import LOGGER, WidgetLogHandler, log_file_handler
 from ._ui.tab_logs import TasksLog
@@ -41,19 +44,23 @@ class TQManager(QMainWindow):
         """
         super().__init__(parent)
 
-        config_path = get_config_path(app_name)
-        config_path.mkdir(exist_ok=True, parents=True)
+        self._config_path = get_config_path(app_name)
+        self._config_path.mkdir(exist_ok=True, parents=True)
 
-        self.setStyleSheet(get_qss_path(config_path).read_text())
+        self.setStyleSheet(get_qss_path(self._config_path).read_text())
 
         with open_settings() as s:
             settings = s
 
+        self._settings = settings
+
         # logs
-        self._logs = TasksLog()
-        LOGGER.widget = WidgetLogHandler(self._logs, settings.enable_debug)
         LOGGER.info('Initializing TQManager')
-        LOGGER.addHandler(log_file_handler(config_path))
+        LOGGER.addHandler(log_file_handler(self._config_path))
+
+        # lines logged before the logs widget is created are buffered by the handler
+        self._log_handler = WidgetLogHandler(settings.enable_debug, settings.max_log_lines)
+        LOGGER.widget = self._log_handler
 
         # core logic
         self.executor = TaskExecutor(settings.max_workers)
@@ -69,13 +76,26 @@ class TQManager(QMainWindow):
 
         splitter = QSplitter(Qt.Vertical)
         splitter.addWidget(self._view)
-        splitter.addWidget(self._logs)
+
+        # the logs are created the first time their panel is opened
+        splitter.addWidget(LazyWidget(lambda: self._logs))
 
         if os.getenv('DEV_MODE') != '1':
             splitter.setSizes([100, 0])
 
         self.setCentralWidget(splitter)
 
+    @cached_property
+    def _logs(self) -> TasksLog:
+        """The logs widget. Created on first access."""
+        logs = TasksLog(max_lines=self._settings.max_log_lines)
+        self._log_handler.set_widget(logs)
+        return logs
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self._view.tree_view.flush_pending()
+        super().closeEvent(event)
+
     @property
     def callbacks(self) -> _ExecutorCallbacks:
         return self.executor.callbacks
@@ -109,10 +129,13 @@ class TQManager(QMainWindow):
         ```
 
         """
-        for task in tasks:
-            self.executor.add_task(task)
+        added_tasks = self.executor.add_tasks(list(tasks))
+
+        for task in added_tasks:
             self.callbacks.task_added.emit(task)
 
+        self.callbacks.tasks_added.emit(added_tasks)
+
     def add_event(
         self,
         execute: Callable[[TaskExecutable], Any],
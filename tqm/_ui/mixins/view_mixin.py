@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
-from functools import partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
-from PySide2.QtCore import Qt, QPoint, QTimer, QByteArray
+from PySide2.QtCore import (Qt, Slot, QPoint, QTimer, QRunnable, QByteArray,
+                            QThreadPool, QCoreApplication)
 from PySide2.QtWidgets import QMenu, QAction
 
 from ..._core.settings import open_settings
@@ -12,6 +13,19 @@ if TYPE_CHECKING:
     from ..._ui.ui_view_model import TaskTreeView
 
 
+class _SaveStateJob(QRunnable):
+    """Write a header state to the settings from a worker thread."""
+
+    def __init__(self, view_key: str, state: str) -> None:
+        super().__init__()
+        self._view_key = view_key
+        self._state = state
+
+    def run(self) -> None:
+        with open_settings(mode='w') as settings:
+            settings.view[self._view_key]['state'] = self._state
+
+
 class ViewStateMixing:
     """
     Mixin for handling the persistent state of a view.
@@ -41,13 +55,30 @@ class ViewStateMixing:
         self.__parent = 'tasks'
 
         self.__initial_state = self.__header.saveState()
-        self.__columns: Dict[str, int] = {}
+        self.__columns: Optional[Mapping[str, int]] = None
+
+        self.__header_menu: Optional[QMenu] = None
+        self.__header_actions: Dict[str, QAction] = {}
 
         self.__timer = QTimer()
-        self.__timer.setInterval(2000)
+        self.__timer.setInterval(500)
         self.__timer.timeout.connect(self._save_table_state)
         self.__timer.setSingleShot(True)
 
+        # a single thread keeps the settings writes in order
+        self.__settings_pool = QThreadPool()
+        self.__settings_pool.setMaxThreadCount(1)
+
+        self.__pending_columns: Dict[str, bool] = {}
+        self.__columns_timer = QTimer()
+        self.__columns_timer.setInterval(500)
+        self.__columns_timer.timeout.connect(self._save_columns_state)
+        self.__columns_timer.setSingleShot(True)
+
+        app = QCoreApplication.instance()
+        if app:
+            app.aboutToQuit.connect(self.flush_pending)
+
         self.__header.sectionMoved.connect(self._activate_timer)
         self.__header.sectionResized.connect(self._activate_timer)
         self.__header.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -61,21 +92,41 @@ class ViewStateMixing:
                 }
 
     def _activate_timer(self) -> None:
-        if not self.__timer.isActive():
-            self.__timer.start()
+        # restarting the timer delays the save until the user stops dragging
+        self.__timer.start()
 
-    def get_columns(self) -> Dict[str, int]:
+    def get_columns(self) -> Mapping[str, int]:
         """
         Map the column names to their respective indices.
 
+        The mapping is cached until the model is reset.
+
         Returns:
-            dict[str, int]: A dictionary mapping column names to their indices.
+            Mapping[str, int]: A read-only mapping of column names to their indices.
 
         """
-        if not self.__columns:
-            self.__columns = self.__view.get_column_indexes()
+        if self.__columns is None:
+            self.__columns = MappingProxyType(self.__view.get_column_indexes())
+            self.__view.tasks_model.modelReset.connect(self._invalidate_columns)
         return self.__columns
 
+    def _invalidate_columns(self) -> None:
+        """
+        Drop the cached columns mapping.
+
+        Returns:
+            None
+
+        """
+        self.__view.tasks_model.modelReset.disconnect(self._invalidate_columns)
+        self.__columns = None
+
+        # the menu actions are bound to the old columns
+        if self.__header_menu:
+            self.__header_menu.deleteLater()
+        self.__header_menu = None
+        self.__header_actions.clear()
+
     def load_table_state(self) -> None:
         """
         Loads the state of the table from the settings and applies it to the view.
@@ -89,21 +140,21 @@ class ViewStateMixing:
 
         """
         with open_settings() as s:
-            settings = s
-
-        current_state = settings.view[self.__parent]['state']
+            view_settings = s.view[self.__parent]
 
-        state = QByteArray.fromBase64(settings.view[self.__parent]['state'].encode())
+        current_state = view_settings['state']
+        columns_visibility = view_settings['columns']
 
-        if state.isEmpty():
+        if current_state:
+            state = QByteArray.fromBase64(current_state.encode('ascii'))
+        else:
             state = self.__initial_state
 
         self.__header.restoreState(state)
 
+        set_column_hidden = self.__view.setColumnHidden
         for column, index in self.get_columns().items():
-            self.__view.setColumnHidden(
-                index, not settings.view[self.__parent]['columns'].get(column, True)
-            )
+            set_column_hidden(index, not columns_visibility.get(column, True))
 
         # when running first time, we want to set the size automatically
         if not current_state:
@@ -121,16 +172,51 @@ class ViewStateMixing:
             None
 
         """
+        # the header must be read from the GUI thread, only the write is offloaded
+        state = self.__header.saveState().toBase64().data().decode()
+        self.__settings_pool.start(_SaveStateJob(self.__parent, state))
+
+    def _save_columns_state(self) -> None:
+        """
+        Save the pending columns visibility to the settings.
+
+        Returns:
+            None
+
+        """
+        if not self.__pending_columns:
+            return
+
         with open_settings(mode='w') as settings:
-            settings.view[self.__parent]['state'] = (
-                self.__header.saveState().toBase64().data().decode()
-            )
+            settings.view[self.__parent]['columns'].update(self.__pending_columns)
+
+        self.__pending_columns.clear()
+
+    def flush_pending(self) -> None:
+        """
+        Write any pending table state to the settings immediately.
+
+        Returns:
+            None
+
+        """
+        if self.__columns_timer.isActive():
+            self.__columns_timer.stop()
+        self._save_columns_state()
+
+        if self.__timer.isActive():
+            self.__timer.stop()
+            self._save_table_state()
+
+        self.__settings_pool.waitForDone()
 
     def _update_columns(self, column_name: str, state: bool) -> None:
         """
         Update the visibility of a column.
 
         This method updates the visibility of a column based on the provided state.
+        The visibility is applied immediately, while the settings are written once
+        the user stops toggling columns.
 
         Args:
             column_name (str): The name of the column to update.
@@ -140,16 +226,22 @@ class ViewStateMixing:
             None
 
         """
-        with open_settings(mode='w') as settings:
-            settings.view[self.__parent]['columns'][column_name] = state
-            self.__view.setColumnHidden(self.get_columns()[column_name], not state)
+        self.__view.setColumnHidden(self.get_columns()[column_name], not state)
+        self.__pending_columns[column_name] = state
+        self.__columns_timer.start()
+
+    @Slot(bool)
+    def _on_column_toggled(self, state: bool) -> None:
+        """Update the column stored in the data of the toggled action."""
+        self._update_columns(self.__view.sender().data(), state)
 
     def _on_header_menu(self, pos: QPoint) -> None:
         """
         Show the context menu for customizing column visibility.
 
         This method shows a context menu with actions for hiding or showing columns
-        based on the current visibility state.
+        based on the current visibility state. The menu is built on first use and
+        only its checked state is refreshed afterwards.
 
         Args:
             pos (QPoint): The position of the context menu.
@@ -158,16 +250,25 @@ class ViewStateMixing:
             None
 
         """
-        menu = QMenu(self.__view)
+        columns = self.get_columns()
+
+        if not self.__header_menu:
+            self.__header_menu = QMenu(self.__view)
 
-        for col, i in self.get_columns().items():
+            for col in columns:
+                act = QAction(col, self.__view, checkable=True)
+                act.setData(col)
+                act.toggled.connect(self._on_column_toggled)
+                self.__header_menu.addAction(act)
+                self.__header_actions[col] = act
 
-            act = QAction(col, self.__view, checkable=True)
-            act.setChecked(not self.__view.isColumnHidden(i))
-            act.toggled.connect(partial(self._update_columns, col))
-            menu.addAction(act)
+        for col, act in self.__header_actions.items():
+            # the state is only being synced, don't trigger a settings write
+            act.blockSignals(True)
+            act.setChecked(not self.__view.isColumnHidden(columns[col]))
+            act.blockSignals(False)
 
-        menu.exec_(self.__view.mapToGlobal(pos))
+        self.__header_menu.exec_(self.__view.mapToGlobal(pos))
 
     def reset_table_state(self) -> None:
         """
@@ -177,6 +278,14 @@ class ViewStateMixing:
         to the initial state.
 
         """
+        self.__columns_timer.stop()
+        self.__pending_columns.clear()
+
+        # a header state saved after the reset would bring the old layout back
+        self.__timer.stop()
+        self.__settings_pool.clear()
+        self.__settings_pool.waitForDone()
+
         with open_settings(mode='w') as settings:
             settings.view.update({self.__parent: {'state': '', 'columns': {}}})
         self.load_table_state()
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import random
-from uuid import UUID
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, Tuple
 
-from PySide2.QtGui import QPainter, QPalette
-from PySide2.QtCore import Qt, QTimer, QObject, QModelIndex
+from PySide2.QtGui import QColor, QRegion, QPainter, QPalette
+from PySide2.QtCore import (Qt, QEvent, QTimer, QObject, QModelIndex,
+                            QPersistentModelIndex)
 from PySide2.QtWidgets import (QStyle, QApplication, QStyledItemDelegate,
                                QStyleOptionViewItem, QStyleOptionProgressBar)
 
@@ -24,12 +23,25 @@ class ProgressBarAnimator(QObject):
         self._parent = parent
 
         self._animation_counter = 0
-        self._task_offsets: Dict[UUID, int] = {}
+
+        # progress indexes painted since the last tick, keyed by task id
+        self._animating_indexes: Dict[int, QPersistentModelIndex] = {}
 
         self._animation_timer = QTimer(self)
         self._animation_timer.setInterval(50)  # 50ms = 20fps
         self._animation_timer.timeout.connect(self._update_animation)
 
+        # pause the animation while the view is not visible
+        self._parent.viewport().installEventFilter(self)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Hide:
+            self.stop_animation()
+        elif event.type() == QEvent.Show:
+            # the timer stops on its own if no task needs to be animated
+            self.start_animation()
+        return super().eventFilter(watched, event)
+
     def start_animation(self) -> None:
         """Start the animation timer if not already running"""
         if not self._animation_timer.isActive():
@@ -40,19 +52,40 @@ class ProgressBarAnimator(QObject):
         if self._animation_timer.isActive():
             self._animation_timer.stop()
 
+    def register_index(self, task: TaskUnit, index: QModelIndex) -> None:
+        """Register a progress index to be repainted on the next tick."""
+        self._animating_indexes[id(task)] = QPersistentModelIndex(index)
+
     def _update_animation(self) -> None:
-        """Update the animation counter on timer tick."""
+        """Update the animation counter and repaint only the animating cells."""
+        if (
+            not self._parent.isVisible()
+            or self._parent.viewport().visibleRegion().isEmpty()
+        ):
+            return
+
         self._animation_counter = (self._animation_counter + 3) % 200
-        self._parent.viewport().update()
 
-    def get_task_animation_value(self, task: TaskUnit) -> int:
-        """Get animation value for a specific task, with random offset for variety."""
+        # indexes still animating will register again when they are painted
+        indexes = self._animating_indexes
+        self._animating_indexes = {}
+
+        region = QRegion()
+        for index in indexes.values():
+            if index.isValid():
+                region = region.united(self._parent.visualRect(index))
+
+        if region.isEmpty():
+            self.stop_animation()
+            return
 
-        # Generate a random offset for this task if it doesn't exist
-        if task.id not in self._task_offsets:
-            self._task_offsets[task.id] = random.randint(0, 100)
+        self._parent.viewport().update(region)
 
-        animation_value = (self._animation_counter + self._task_offsets[task.id]) % 200
+    def get_task_animation_value(self, task: TaskUnit) -> int:
+        """Get animation value for a specific task, with a per task offset for variety."""
+
+        # the task id is random, so its low bits make a stable offset (0-127)
+        animation_value = (self._animation_counter + (task.id.int & 0x7F)) % 200
         if animation_value > 100:
             animation_value = 200 - animation_value  # reverse direction after 100
 
@@ -61,12 +94,18 @@ class ProgressBarAnimator(QObject):
     def cleanup(self) -> None:
         """Stop timer and clear resources"""
         self.stop_animation()
-        self._task_offsets.clear()
+        self._animating_indexes.clear()
 
 
 class ProgressBarRenderer:
     """Handles rendering logic for progress bars"""
 
+    # (state, rgba) -> darker group color
+    _DARKER_CACHE: Dict[Tuple[str, int], QColor] = {}
+
+    # state -> title text
+    _TITLE_CACHE: Dict[str, str] = {}
+
     @staticmethod
     def handle_determinate_progress(
         pbar_options: QStyleOptionProgressBar,
@@ -95,19 +134,30 @@ class ProgressBarRenderer:
         pbar_options.progress = animation_value
         pbar_options.text = task.progress_bar.working_text
 
-    @staticmethod
+    @classmethod
     def handle_completed_state(
+        cls,
         pbar_options: QStyleOptionProgressBar,
         task: TaskUnit,
         progress: int
     ) -> None:
         """Configure progress bar options for completed/inactive tasks"""
-        text = task.state.current.title()
+        state = task.state.current
+
+        text = cls._TITLE_CACHE.get(state)
+        if text is None:
+            text = cls._TITLE_CACHE[state] = state.title()
+
         color = task.state.color
 
         if isinstance(task, TaskGroup):
             text = f'Group: {text} - {progress}/{len(task.tasks)}'
-            color = color.darker()
+
+            key = (state, color.rgba())
+            darker = cls._DARKER_CACHE.get(key)
+            if darker is None:
+                darker = cls._DARKER_CACHE[key] = color.darker()
+            color = darker
 
         if task.state.is_completed:
             pbar_options.maximum = task.progress_bar.maximum
@@ -126,6 +176,11 @@ class ProgressBarDelegate(QStyledItemDelegate):
         self._animator = ProgressBarAnimator(parent)
         self._renderer = ProgressBarRenderer()
 
+        self._progress_bar_element = QStyle.CE_ProgressBar
+
+        # reused on every paint; all the fields are reset in `paint_progress_bar`
+        self._pbar_options = QStyleOptionProgressBar()
+
     def start_animation(self) -> None:
         """Start the animation timer"""
         self._animator.start_animation()
@@ -142,9 +197,12 @@ class ProgressBarDelegate(QStyledItemDelegate):
         task: TaskUnit
     ) -> None:
         """Paint the progress bar for a task"""
-        pbar_options = QStyleOptionProgressBar()
+        pbar_options = self._pbar_options
         pbar_options.rect = option.rect
+        pbar_options.palette = option.palette
         pbar_options.textVisible = True
+        pbar_options.progress = 0
+        pbar_options.text = ''
 
         pbar_options.minimum = task.progress_bar.minimum
         pbar_options.maximum = task.progress_bar.maximum
@@ -158,11 +216,14 @@ class ProgressBarDelegate(QStyledItemDelegate):
                 animation_value = self._animator.get_task_animation_value(task)
                 self._renderer.handle_indeterminate_progress(pbar_options, animation_value, task)
                 # Start animation if not already running
+                self._animator.register_index(task, index)
                 self._animator.start_animation()
         else:
             self._renderer.handle_completed_state(pbar_options, task, progress)
 
-        QApplication.style().drawControl(QStyle.CE_ProgressBar, pbar_options, painter)
+        # looked up per paint: a style change deletes the previous QStyle
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(self._progress_bar_element, pbar_options, painter)
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
         task: TaskUnit = index.siblingAtColumn(0).data(Qt.UserRole)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional
+from typing import List, Optional
+from collections import OrderedDict
 
-from PySide2.QtCore import Qt, QDir, Slot, QPoint, QDateTime
+from PySide2.QtGui import QTextCursor
+from PySide2.QtCore import Qt, QDir, Slot, QPoint, QTimer, QDateTime
 from PySide2.QtWidgets import (QAction, QWidget, QFileDialog, QVBoxLayout,
                                QPlainTextEdit)
 
@@ -21,13 +23,29 @@ LOG_COLORS = {
     'USER':     '#81da27',  # Purple
 }
 
+LOG_LEVEL_TAGS = {level: f'<font color="{color}">' for level, color in LOG_COLORS.items()}
+DEFAULT_LEVEL_TAG = '<font color="white">'
+
+# pending lines are flushed to the widget at most every FLUSH_INTERVAL ms
+FLUSH_INTERVAL = 30
+LARGE_FLUSH_SIZE = 100
+
+MAX_THREAD_COLORS = 256
+
 
 class TasksLog(QWidget):
-    def __init__(self, should_wrap: bool = False, parent: Optional[QWidget] = None) -> None:
+    def __init__(
+        self,
+        should_wrap: bool = False,
+        max_lines: int = 10000,
+        parent: Optional[QWidget] = None
+    ) -> None:
         super().__init__(parent)
 
         self._logs = QPlainTextEdit()
         self._logs.setReadOnly(True)
+        # oldest lines are dropped once the limit is reached (0 means unlimited)
+        self._logs.setMaximumBlockCount(max_lines)
         self._logs.setObjectName('TqmTasksLogs')
         self._logs.setFont(get_monospace_font(14))
         self._logs.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -58,7 +76,14 @@ class TasksLog(QWidget):
             max_value=220,
             exclude_colors=list(LOG_COLORS.values())
         )
-        self._thread_colors: Dict[str, str] = {}
+        # thread name -> opening font tag of its color (least recently used first)
+        self._thread_colors: OrderedDict[str, str] = OrderedDict()
+
+        self._pending: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self._flush)
 
     def _on_contextMenuEvent(self, point: QPoint) -> None:
 
@@ -104,25 +129,71 @@ class TasksLog(QWidget):
 
     @Slot()
     def on_clear_logs(self) -> None:
+        self._pending.clear()
         self._logs.clear()
 
+    @Slot()
+    def _flush(self) -> None:
+        """Insert all the pending lines in a single edit block."""
+        if not self._pending:
+            return
+
+        is_large = len(self._pending) > LARGE_FLUSH_SIZE
+        if is_large:
+            self._logs.setUpdatesEnabled(False)
+
+        # only follow the new lines if the user has not scrolled up
+        scrollbar = self._logs.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+
+        document = self._logs.document()
+        needs_block = not document.isEmpty()
+
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+
+        for line in self._pending:
+            if needs_block:
+                cursor.insertBlock()
+            cursor.insertHtml(line)
+            needs_block = True
+
+        cursor.endEditBlock()
+        self._pending.clear()
+
+        if is_large:
+            self._logs.setUpdatesEnabled(True)
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
+
     def log(self, text: str, level_name: str = 'INFO', thread: str = '') -> None:
         # TODO: Add a no color flag?
 
         # we need to replace the regular space with html space if we want to keep
-        # the formatting
+        # the formatting. NOTE: str.replace is much faster than str.translate for
+        # a one to many characters substitution
         text = text.replace(' ', '&nbsp;')
 
-        if thread not in self._thread_colors:
-            self._thread_colors[thread] = self._random_color.generate().name()
+        thread_tag = self._thread_colors.get(thread)
+        if thread_tag is None:
+            if len(self._thread_colors) >= MAX_THREAD_COLORS:
+                self._thread_colors.popitem(last=False)
+            thread_tag = f'<font color="{self._random_color.generate().name()}">'
+            self._thread_colors[thread] = thread_tag
+        else:
+            self._thread_colors.move_to_end(thread)
 
         # use a different color for the log level
-        log_level_color = LOG_COLORS[level_name] if level_name in LOG_COLORS else 'white'
-        parts = text.split('|', 2)
-        parts[1] = f'<font color="{log_level_color}">{parts[1]}</font>'
-        text = '|'.join(parts)
-
-        self._logs.appendHtml(f'<font color="{self._thread_colors[thread]}">{text}</font>')
-        self._logs.verticalScrollBar().setValue(
-            self._logs.verticalScrollBar().maximum()
-        )
+        timestamp, _, text = text.partition('|')
+        level, _, message = text.partition('|')
+
+        self._pending.append(''.join((
+            thread_tag, timestamp, '|',
+            LOG_LEVEL_TAGS.get(level_name, DEFAULT_LEVEL_TAG), level, '</font>|',
+            message, '</font>'
+        )))
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
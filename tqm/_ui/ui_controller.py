@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
-from functools import partial
+import contextlib
+from typing import Any, Set, Dict, List, Tuple, Callable, Optional
 
-from PySide2.QtCore import Qt, Slot, Signal, QObject
+from PySide2.QtCore import Qt, Slot, QTimer, Signal, QObject
 from PySide2.QtWidgets import QWidget, QInputDialog
 
 from .._core.task import TaskUnit, TaskGroup, TaskExecutable
 from .ui_view_model import TaskManagerView
 from .._core.settings import Settings, open_settings
+from .._core.task_runner import RunnerSignals
 from .._core.task_executor import TaskExecutor
 
 
@@ -89,7 +90,7 @@ class _TaskButtonsController(QObject):
         with open_settings('w') as s:
             s.max_workers = value
 
-    @Slot()
+    @Slot(bool)
     def toggle_expand(self, expand: bool) -> None:
         self._view.toggle_expand(expand)
 
@@ -99,37 +100,48 @@ class _TaskButtonsController(QObject):
 
     @Slot()
     def resize_columns(self) -> None:
-        for i in range(self._view.tree_view.tasks_model.columnCount()):
-            self._view.tree_view.setColumnWidth(i, 250)
+        tree_view = self._view.tree_view
+        column_count = tree_view.tasks_model.columnCount()
+
+        header = tree_view.header()
+        header.setUpdatesEnabled(False)
+        try:
+            for i in range(column_count):
+                tree_view.setColumnWidth(i, 250)
+        finally:
+            header.setUpdatesEnabled(True)
+            header.updateGeometry()
+
+    def _remove_tasks_by_state(self, state: str) -> None:
+        with self._view.tree_view.bulk_update():
+            for task in self._executor.get_tasks_by_state(state):
+                self._executor.remove_task(task)
 
     @Slot()
     def retry_all_failed(self) -> None:
-        for task in self._controller.get_all_tasks():
-            if task.state.is_failed:
-                self._executor.retry_task(task)
+        with self._view.tree_view.bulk_update():
+            for task in self._executor.get_tasks_by_state('failed'):
+                # retrying a task might have already retried its children or group
+                if task.state.is_failed:
+                    self._executor.retry_task(task)
 
     @Slot()
     def clear_completed_tasks(self) -> None:
-        for task in self._controller.get_all_tasks():
-            if task.state.is_completed:
-                self._executor.remove_task(task)
+        self._remove_tasks_by_state('completed')
 
     @Slot()
     def clear_failed_tasks(self) -> None:
-        for task in self._controller.get_all_tasks():
-            if task.state.is_failed:
-                self._executor.remove_task(task)
+        self._remove_tasks_by_state('failed')
 
     @Slot()
     def clear_waiting_tasks(self) -> None:
-        for task in self._controller.get_all_tasks():
-            if task.state.is_waiting:
-                self._executor.remove_task(task)
+        self._remove_tasks_by_state('waiting')
 
     @Slot()
     def clear_all_tasks(self) -> None:
-        for task in self._controller.get_all_tasks():
-            self._executor.remove_task(task)
+        with self._view.tree_view.bulk_update():
+            for task in self._controller.get_all_tasks():
+                self._executor.remove_task(task)
 
 
 class TaskManagerController(QObject):
@@ -149,13 +161,39 @@ class TaskManagerController(QObject):
         self._settings = settings
         self._executor = executor
 
+        # top level tasks in the view, in insertion order
+        self._tasks: Dict[TaskUnit, None] = {}
+        # top level tasks followed by their group tasks, rebuilt after add/remove
+        self._all_tasks: Optional[List[TaskUnit]] = None
+
+        # the columns never change, so their indexes are resolved only once
+        tree_view = self.view.tree_view
+        self._progress_column = tree_view.get_column_index('Progress')
+        self._started_column = tree_view.get_column_index('Started')
+        self._completed_column = tree_view.get_column_index('Completed')
+
+        # latest progress of each task, applied to the view at most ~30 times per second
+        self._pending_progress: Dict[TaskUnit, float] = {}
+        # task -> the runner signals its progress callback is connected to
+        self._progress_bindings: Dict[
+            TaskUnit, Tuple[RunnerSignals, Callable[[float], None]]
+        ] = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # group -> its completed tasks, updated as each task finishes
+        self._group_completed: Dict[TaskGroup, Set[TaskExecutable]] = {}
+
         view.toolbar.run_all_tasks.clicked.connect(executor.start_workers)
 
-        executor.callbacks.task_added.connect(self.add_task)
+        executor.callbacks.tasks_added.connect(self.add_tasks)
         executor.callbacks.task_finished.connect(self._on_task_finished)
         executor.callbacks.runner_completed.connect(self._on_task_completed)
         executor.callbacks.runner_started.connect(self._on_task_started)
         executor.callbacks.task_removed.connect(self.remove_task)
+        executor.callbacks.task_retried.connect(self._on_task_retried)
 
         self.ops = _TaskButtonsController(self.view, executor, self)
 
@@ -165,28 +203,38 @@ class TaskManagerController(QObject):
     def _update_item_data(
         self,
         task: TaskUnit,
-        column_name: str,
+        column: int,
         value: Any,
         role: Qt.ItemDataRole = Qt.DisplayRole
     ) -> None:
         """Set data to a task item."""
-        if not task.item:
+        if not task.row_items:
             return
 
-        parent = task.item.parent()
-        item = parent.child if parent else self.view.tree_view.tasks_model.item
-        column = self.view.tree_view.get_column_index(column_name)
-        item(task.item.row(), column).setData(value, role)
+        task.row_items[column].setData(value, role)
 
-    @Slot(object, float)
     def _on_task_update_progress(self, task: TaskUnit, value: float) -> None:
-        """Update the progress bar of a task."""
-        self._update_item_data(task, 'Progress', round(value, 2))
+        """Queue a progress update of a task, only the latest value is kept."""
+        self._pending_progress[task] = value
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @Slot()
+    def _flush_progress(self) -> None:
+        """Update the progress bar of all the tasks with a pending progress."""
+        pending = self._pending_progress
+        self._pending_progress = {}
+
+        for task, value in pending.items():
+            self._update_item_data(task, self._progress_column, round(value, 2))
 
     @Slot(object)
     def _on_task_completed(self, task: TaskExecutable, *args: Any, **kwargs: Any) -> None:
-        self._on_task_update_progress(task, task.progress_bar.maximum)
-        self._update_item_data(task, 'Completed', task.state.get_last().timestamp)
+        self._pending_progress.pop(task, None)
+        self._update_item_data(task, self._progress_column, task.progress_bar.maximum)
+        self._update_item_data(
+            task, self._completed_column, task.state.get_last().timestamp
+        )
 
     @Slot(object)
     def _on_task_finished(self, task: TaskUnit) -> None:
@@ -197,23 +245,68 @@ class TaskManagerController(QObject):
         if not group:
             return
 
-        completed_tasks = len(list(filter(lambda t: t.state.is_completed, group.tasks)))
-        self._update_item_data(group, 'Progress', completed_tasks)
+        completed_tasks = self._group_completed.setdefault(group, set())
+        if task.state.is_completed:
+            completed_tasks.add(task)
+        else:
+            completed_tasks.discard(task)
+
+        self._update_item_data(group, self._progress_column, len(completed_tasks))
 
     @Slot(object)
     def _on_task_started(self, task: TaskUnit) -> None:
-        self._update_item_data(task, 'Started', task.state.get_last().timestamp)
+        self._update_item_data(task, self._started_column, task.state.get_last().timestamp)
 
     @Slot()
     def _on_retry_selected(self) -> None:
         for task in self.get_selected_tasks():
             self._executor.retry_task(task)
 
-    def add_task(self, task: TaskUnit) -> None:
+    def _add_task_item(self, task: TaskUnit) -> None:
         task.item = self.view.tree_view.tasks_model.add_task(task)
-        task.runner.signals.task_progress_updated.connect(
-            partial(self._on_task_update_progress, task)
-        )
+        self._tasks[task] = None
+        self._all_tasks = None
+
+        self._bind_progress(task)
+
+    def _bind_progress(self, task: TaskUnit) -> None:
+        """Connect the progress of the task's current runner to the view."""
+        self._unbind_progress(task)
+
+        def on_progress(value: float) -> None:
+            self._on_task_update_progress(task, value)
+
+        # keep the signals the callback is connected to: a retry replaces the runner
+        signals = task.runner.signals
+        signals.task_progress_updated.connect(on_progress)
+        self._progress_bindings[task] = (signals, on_progress)
+
+    def _unbind_progress(self, task: TaskUnit) -> None:
+        binding = self._progress_bindings.pop(task, None)
+        if not binding:
+            return
+
+        signals, on_progress = binding
+        # the signals object might already be gone with its runner
+        with contextlib.suppress(RuntimeError):
+            signals.task_progress_updated.disconnect(on_progress)
+
+    @Slot(object)
+    def _on_task_retried(self, task: TaskUnit) -> None:
+        if task in self._progress_bindings:
+            self._bind_progress(task)
+
+    @Slot(list)
+    def add_tasks(self, tasks: List[TaskUnit]) -> None:
+        """Add multiple tasks to the view with a single repaint and expand."""
+        if len(tasks) == 1:
+            # a single row, even a group with its tasks, is cheaper without the bulk pass
+            self._add_task_item(tasks[0])
+        else:
+            with self.view.tree_view.bulk_update():
+                for task in tasks:
+                    self._add_task_item(task)
+
         self.view.toggle_expand(True)
 
     def remove_task(self, task: TaskUnit) -> None:
@@ -234,6 +327,22 @@ class TaskManagerController(QObject):
             - If the task's item does not have a parent group, it is removed
               directly from the tasks model.
         """
+        self._tasks.pop(task, None)
+        self._all_tasks = None
+        self._pending_progress.pop(task, None)
+
+        self._unbind_progress(task)
+
+        if isinstance(task, TaskGroup):
+            self._group_completed.pop(task, None)
+            for child in task.tasks:
+                child.row_items = []
+        elif task.group and task.group in self._group_completed:
+            self._group_completed[task.group].discard(task)
+
+        # the row is about to be deleted, drop the references to its items
+        task.row_items = []
+
         if not task.item:
             return
 
@@ -257,13 +366,14 @@ class TaskManagerController(QObject):
 
     def get_all_tasks(self) -> List[TaskUnit]:
         """Get a list of all tasks in the tree view."""
-        tasks: List[TaskUnit] = []
-        for i in range(self.view.tree_view.tasks_model.rowCount()):
-            item = self.view.tree_view.tasks_model.item(i, 0).data(Qt.UserRole)
-            tasks.append(item)
-            if isinstance(item, TaskGroup):
-                tasks.extend(item.tasks)
-        return tasks
+        if self._all_tasks is None:
+            self._all_tasks = []
+            for task in self._tasks:
+                self._all_tasks.append(task)
+                if isinstance(task, TaskGroup):
+                    self._all_tasks.extend(task.tasks)
+
+        return list(self._all_tasks)
 
     def get_selected_tasks(self) -> List[TaskUnit]:
         """Get a list of selected tasks in the tree view."""
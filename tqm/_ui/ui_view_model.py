@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Tuple, Union, Optional
-from functools import partial
+from typing import Any, Dict, List, Tuple, Optional, Generator
+from functools import cache, partial
+from contextlib import contextmanager
 
 from PySide2.QtGui import (QIcon, QStandardItem, QContextMenuEvent,
                            QStandardItemModel)
-from PySide2.QtCore import Qt, Slot, Signal, QModelIndex, QSortFilterProxyModel
+from PySide2.QtCore import (Qt, Slot, QTimer, Signal, QModelIndex,
+                            QSortFilterProxyModel)
 from PySide2.QtWidgets import (QMenu, QAction, QWidget, QSplitter, QTreeView,
                                QVBoxLayout)
 
 from .toolbar import TasksViewToolbar
-from ..widgets import Frame
+from ..widgets import Frame, LazyWidget
 from .task_item import TaskItem
 from .._core.task import TaskUnit, TaskGroup, TaskExecutable
 from ..exceptions import TaskGroupError
@@ -19,15 +21,16 @@ from .font_loader import get_monospace_font
 from .context_menu import TaskFileMenu
 from .debug_widget import DebugWidget
 from .mixins.view_mixin import ViewStateMixing
-from .._core.task_actions import TaskAction, TaskActionVisibility
+from .._core.task_actions import TaskActionVisibility
 from .._core.task_executor import TaskExecutor
 from .progress_bar_delegate import ProgressBarDelegate
 from .mixins.multi_select_mixin import MultiSelectMixin
 
-_TaskActionsT = Union[
-    Tuple[TaskAction[TaskExecutable], ...],
-    Tuple[TaskAction[TaskGroup], ...]
-]
+
+@cache
+def _get_icon(path: str) -> QIcon:
+    """Get a shared icon. Created on first use since it needs a QApplication."""
+    return QIcon(path)
 
 
 class TreeModel(QStandardItemModel):
@@ -47,14 +50,14 @@ class TreeModel(QStandardItemModel):
 
         self.itemChanged.connect(self._on_item_changed)
 
-    @Slot(TaskItem)
+    @Slot(QStandardItem)
     def _on_item_changed(self, item: TaskItem) -> None:
         if item.column() == self.columns['Comment']:
             task = self.itemFromIndex(item.index().siblingAtColumn(0)).data(Qt.UserRole)
             task.comment = item.text()
 
-    def _create_task_row(self, item: TaskItem, task: TaskUnit) -> List[TaskItem]:
-        return [
+    def _create_task_row(self, item: TaskItem, task: TaskUnit) -> List[QStandardItem]:
+        task.row_items = [
             item,
             TaskItem('', has_progress=True),
             TaskItem(task.parent.name if task.parent else ''),
@@ -63,6 +66,7 @@ class TreeModel(QStandardItemModel):
             TaskItem('', alignment=Qt.AlignCenter),
             TaskItem('', alignment=Qt.AlignCenter),
         ]
+        return task.row_items
 
     def _configure_group_item(self, task_group: TaskGroup) -> None:
         if not task_group.tasks:
@@ -78,7 +82,7 @@ class TreeModel(QStandardItemModel):
                 f'Expected TaskGroup "{task_group.name}" to have an associated group item, but none was found.'
             )
 
-        group_item.setIcon(QIcon(':/icons/dark/circle-parent'))
+        group_item.setIcon(_get_icon(':/icons/dark/circle-parent'))
         f = group_item.font()
         f.setBold(True)
         group_item.setFont(f)
@@ -87,7 +91,7 @@ class TreeModel(QStandardItemModel):
             task.color = task_group.color
 
             task.item = TaskItem(task.name, foreground=task.color)
-            task.item.setIcon(QIcon(':/icons/dark/circle-line'))
+            task.item.setIcon(_get_icon(':/icons/dark/circle-line'))
             task.item.setData(task, Qt.UserRole)
 
             group_item.appendRow(self._create_task_row(task.item, task))
@@ -95,7 +99,7 @@ class TreeModel(QStandardItemModel):
     def add_task(self, task_unit: TaskUnit) -> TaskItem:
 
         task_unit.item = TaskItem(task_unit.name, foreground=task_unit.color)
-        task_unit.item.setIcon(QIcon(':/icons/dark/circle-filled'))
+        task_unit.item.setIcon(_get_icon(':/icons/dark/circle-filled'))
         task_unit.item.setData(task_unit, Qt.UserRole)
 
         if isinstance(task_unit, TaskGroup):
@@ -116,23 +120,33 @@ class RecursiveFilterProxyModel(QSortFilterProxyModel):
         super().__init__(parent)
 
     def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Accept a row if the row or any of its descendants matches the filter."""
 
         if super().filterAcceptsRow(source_row, source_parent):
             return True
 
         model = self.sourceModel()
-        source_index = model.index(source_row, 0, source_parent)
 
-        if source_index.isValid():
-            rows = model.rowCount(source_index)
-            for i in range(rows):
-                if self.filterAcceptsRow(i, source_index):
+        # iterative depth first search of the descendants
+        stack = [model.index(source_row, 0, source_parent)]
+        while stack:
+            source_index = stack.pop()
+            if not source_index.isValid():
+                continue
+
+            for i in range(model.rowCount(source_index)):
+                if super().filterAcceptsRow(i, source_index):
                     return True
+
+                child = model.index(i, 0, source_index)
+                if model.hasChildren(child):
+                    stack.append(child)
+
         return False
 
 
 class TaskTreeView(MultiSelectMixin, ViewStateMixing, QTreeView):
-    selected_task_retried = Signal(TaskExecutable)
+    selected_task_retried = Signal(object)
     selected_task_removed = Signal()
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -166,6 +180,72 @@ class TaskTreeView(MultiSelectMixin, ViewStateMixing, QTreeView):
         self.load_table_state()
         self.setSortingEnabled(True)
 
+        self._bulk_depth = 0
+        self._bulk_rows_changed = False
+        self._context_menu: Optional[Tuple[Tuple[Any, int], QMenu]] = None
+
+    def begin_bulk(self) -> None:
+        """Suspend repaints and proxy re-filtering until `end_bulk` is called.
+
+        Calls can be nested, only the outermost `end_bulk` resumes the updates.
+        """
+        self._bulk_depth += 1
+        if self._bulk_depth > 1:
+            return
+
+        self._bulk_rows_changed = False
+        self.tasks_model.rowsInserted.connect(self._on_bulk_rows_changed)
+        self.tasks_model.rowsRemoved.connect(self._on_bulk_rows_changed)
+
+        self.setUpdatesEnabled(False)
+        self.proxy_model.setDynamicSortFilter(False)
+
+    def end_bulk(self) -> None:
+        """Resume the updates suspended by `begin_bulk`.
+
+        The filter is run again only if rows were inserted or removed meanwhile.
+        Re-enabling the dynamic sort filter already sorts the rows again.
+        """
+        self._bulk_depth -= 1
+        if self._bulk_depth > 0:
+            return
+
+        if not self._bulk_rows_changed:
+            self._disconnect_bulk_rows()
+
+        self.proxy_model.setDynamicSortFilter(True)
+        if self._bulk_rows_changed:
+            self.proxy_model.invalidateFilter()
+
+        self.setUpdatesEnabled(True)
+        self.viewport().update()
+
+    def _disconnect_bulk_rows(self) -> None:
+        self.tasks_model.rowsInserted.disconnect(self._on_bulk_rows_changed)
+        self.tasks_model.rowsRemoved.disconnect(self._on_bulk_rows_changed)
+
+    @Slot()
+    def _on_bulk_rows_changed(self) -> None:
+        # one change is enough to know the filter must run again
+        self._bulk_rows_changed = True
+        self._disconnect_bulk_rows()
+
+    @contextmanager
+    def bulk_update(self) -> Generator[None, Any, None]:
+        """Context manager around `begin_bulk` and `end_bulk`.
+
+        ```
+        with tree_view.bulk_update():
+            for task in tasks:
+                executor.remove_task(task)
+        ```
+        """
+        self.begin_bulk()
+        try:
+            yield
+        finally:
+            self.end_bulk()
+
     def stop_animation(self) -> None:
         self._progress_delegate.cleanup()
 
@@ -178,6 +258,15 @@ class TaskTreeView(MultiSelectMixin, ViewStateMixing, QTreeView):
 
     def get_selected_items(self) -> List[QStandardItem]:
         """Get a list of selected tasks QStandardItem in the tree view."""
+        if self.selectionMode() == QTreeView.SingleSelection:
+            # at most one row can be selected and it is the current one
+            current = self.currentIndex()
+            if not current.isValid() or not self.selectionModel().isSelected(current):
+                return []
+
+            source_index = self.proxy_model.mapToSource(current.siblingAtColumn(0))
+            return [self.tasks_model.itemFromIndex(source_index)]
+
         items: List[QStandardItem] = []
         for index in self.selectionModel().selectedRows():
 
@@ -189,8 +278,24 @@ class TaskTreeView(MultiSelectMixin, ViewStateMixing, QTreeView):
         return items
 
     def contextMenuEvent(self, event: QContextMenuEvent) -> None:
-        def add_actions(actions: _TaskActionsT, visibility: TaskActionVisibility) -> None:
-            for action in filter(lambda a: a.visibility == visibility, actions):
+        item = self.indexAt(event.pos()).siblingAtColumn(0)
+        if not item.isValid() or not item.data(Qt.UserRole):
+            return
+
+        task: TaskUnit = item.data(Qt.UserRole)
+
+        # the menu only changes when the task changes state, so reuse the last one
+        menu_key = (task.id, len(task.state.history))
+        if self._context_menu is None or self._context_menu[0] != menu_key:
+            if self._context_menu is not None:
+                self._context_menu[1].deleteLater()
+            self._context_menu = (menu_key, self._create_context_menu(task))
+
+        self._context_menu[1].exec_(event.globalPos())
+
+    def _create_context_menu(self, task: TaskUnit) -> QMenu:
+        def add_actions(visibility: TaskActionVisibility) -> None:
+            for action in task.actions_by_visibility[visibility]:
                 if action.name == '%file%':
                     # get the file assigned to the action return
                     user_file = action.action(task)
@@ -200,24 +305,19 @@ class TaskTreeView(MultiSelectMixin, ViewStateMixing, QTreeView):
                     act.triggered.connect(partial(action.action, task))
                     menu.addAction(act)
 
-        item = self.indexAt(event.pos()).siblingAtColumn(0)
-        if not item.isValid() or not item.data(Qt.UserRole):
-            return
-
         menu = QMenu(self)
 
-        task: TaskUnit = item.data(Qt.UserRole)
-        add_actions(task.actions, TaskActionVisibility.ALWAYS)
+        add_actions(TaskActionVisibility.ALWAYS)
 
         if task.state.is_completed:
-            add_actions(task.actions, TaskActionVisibility.ON_COMPLETED)
+            add_actions(TaskActionVisibility.ON_COMPLETED)
 
         elif task.state.is_failed:
-            add_actions(task.actions, TaskActionVisibility.ON_FAILED)
+            add_actions(TaskActionVisibility.ON_FAILED)
 
             if isinstance(task, TaskExecutable) and not task.parent:
                 retry_act = QAction('Retry', self)
-                retry_act.triggered.connect(lambda: self.selected_task_retried.emit(task))
+                retry_act.triggered.connect(partial(self.selected_task_retried.emit, task))
                 menu.addAction(retry_act)
 
         menu.addSeparator()
@@ -227,7 +327,7 @@ class TaskTreeView(MultiSelectMixin, ViewStateMixing, QTreeView):
             remove_task.triggered.connect(self.selected_task_removed.emit)
             menu.addAction(remove_task)
 
-        menu.exec_(event.globalPos())
+        return menu
 
 
 class TaskManagerView(QWidget):
@@ -246,11 +346,18 @@ class TaskManagerView(QWidget):
         self.tree_view.clicked.connect(self._on_toggle_debug)
 
         self.toolbar = TasksViewToolbar()
-        self.toolbar.search_bar.textChanged.connect(
-            self.tree_view.proxy_model.setFilterRegExp
-        )
+        self._last_status = ''
+
+        # filter once the user stops typing instead of on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._on_search)
+        self.toolbar.search_bar.textChanged.connect(lambda: self._search_timer.start())
 
-        self._debug_widget = DebugWidget(executor)
+        # created the first time its panel is opened
+        self._executor = executor
+        self._debug_widget: Optional[DebugWidget] = None
 
         table_layout = QVBoxLayout()
         table_layout.addWidget(self.toolbar)
@@ -261,7 +368,9 @@ class TaskManagerView(QWidget):
 
         splitter = QSplitter()
         splitter.addWidget(table_widget)
-        splitter.addWidget(self._debug_widget)
+
+        splitter.addWidget(LazyWidget(self._create_debug_widget))
+
         if os.getenv('DEV_MODE') != '1':
             splitter.setSizes([100, 0])
 
@@ -269,8 +378,25 @@ class TaskManagerView(QWidget):
         layout.addWidget(splitter)
         self.setLayout(layout)
 
+    def _create_debug_widget(self) -> DebugWidget:
+        self._debug_widget = DebugWidget(self._executor)
+
+        # show the task that was selected while the panel was closed
+        selected_items = self.tree_view.get_selected_items()
+        if selected_items:
+            self._debug_widget.populate(selected_items[0].data(Qt.UserRole))
+
+        return self._debug_widget
+
+    @Slot()
+    def _on_search(self) -> None:
+        self.tree_view.proxy_model.setFilterRegExp(self.toolbar.search_bar.text())
+
     @Slot(QModelIndex)
     def _on_toggle_debug(self, index: QModelIndex) -> None:
+        if not self._debug_widget:
+            return
+
         selected_item = self.tree_view.get_selected_items()
         task = selected_item[0].data(Qt.UserRole)
         self._debug_widget.populate(task)
@@ -280,4 +406,8 @@ class TaskManagerView(QWidget):
 
     def update_status(self, status: Dict[str, Any]) -> None:
         stringified_status = ' | '.join(f'{k}: {v}' for k, v in status.items())
+        if stringified_status == self._last_status:
+            return
+
+        self._last_status = stringified_status
         self.toolbar.status_label.setText(stringified_status)
@@ -14,76 +14,120 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import sys
 import time
 import random
 import tempfile
-from functools import partial
-from itertools import count
+from typing import List, Callable
 
 from PySide2.QtGui import QDesktopServices
 from PySide2.QtCore import QUrl
 from PySide2.QtWidgets import QMainWindow, QMessageBox, QApplication
 
-from tqm import (TQManager, TaskBuilder, TaskExecutable, TaskGroupBuilder,
-                 TaskActionVisibility)
+from tqm import (TaskUnit, TQManager, TaskBuilder, TaskExecutable,
+                 TaskGroupBuilder, TaskActionVisibility)
+
+# bound once so the task executes skip the module attribute lookups
+_sleep = time.sleep
+_uniform = random.uniform
+
+_FILE_CONTENT = (
+    'This file was created by TQM Demo.\n\n'
+    'The Queue Task Manager (TQM) is a powerful tool for managing tasks.\n'
+    'You can use it to run multiple tasks in parallel, track their progress,\n'
+    'and manage dependencies between them.'
+)
+_FILE_CONTENT_BYTES = _FILE_CONTENT.encode('utf-8')
+
+_WELCOME_MSG = (
+    'Welcome to the TQM Demo!\n\n'
+    'This demo showcases various features of the Queue Task Manager:\n'
+    '• Simple tasks\n'
+    '• Tasks with progress reporting\n'
+    '• File-related tasks with context menu actions\n'
+    '• Task failure and retry\n'
+    '• Task groups\n'
+    '• Task dependencies\n'
+    '• Task colors\n'
+    '• Complex nested groups\n'
+    '• Task lifecycle callbacks\n\n'
+    "Click 'Start Workers' to begin executing the tasks.\n"
+    'You can interact with tasks by right-clicking on them.'
+)
+
+
+class _FailingTask:
+    """Task execute that fails on the first run and succeeds when retried."""
+
+    def __init__(self) -> None:
+        self.attempts = 0
+
+    def __call__(self, task: TaskExecutable) -> None:
+        self.attempts += 1
+
+        task.log('This task will intentionally fail')
+        _sleep(3)
+        if self.attempts != 2:
+            raise RuntimeError('Task failed intentionally. You can retry it!')
 
 
 class DemoTasks:
-    """Collection of demo tasks for TQM."""
+    """Collection of demo tasks for TQM.
 
-    def __init__(self, manager: TQManager):
-        self.manager = manager
+    Each `build_*` method returns its tasks so they can be added to the manager
+    with a single `add_tasks` call.
+    """
 
-    def add_simple_tasks(self):
-        """Add simple tasks that complete quickly."""
-        self.manager.add_event(
-            execute=lambda t: time.sleep(2.5),
-            label='Simple Task',
-            comment='A basic task that completes quickly'
-        )
+    def build_simple_tasks(self) -> List[TaskUnit]:
+        """Build simple tasks that complete quickly."""
+        return [
+            TaskBuilder('Simple Task')
+            .with_event(lambda t: _sleep(2.5))
+            .with_comment('A basic task that completes quickly')
+            .build()
+        ]
 
-    def add_progress_tasks(self):
-        """Add tasks with progress reporting."""
-
-        def task_with_progress(task: TaskExecutable, steps: int = 10):
-            """Task that reports progress as it executes."""
-            for i in range(steps):
-                progress = (i + 1) / steps * 100
-                task.emit_progress(progress)
-                task.log(f"Progress: {int(progress)}%")
-                time.sleep(0.5)
-
-        self.manager.add_event(
-            execute=partial(task_with_progress, steps=10),
-            show_progress=True,
-            label='Progress Task (10 steps)',
-            comment='Task that reports progress'
-        )
+    def build_progress_tasks(self) -> List[TaskUnit]:
+        """Build tasks with progress reporting."""
 
-        self.manager.add_event(
-            execute=partial(task_with_progress, steps=5),
-            show_progress=True,
-            label='Progress Task (5 steps)',
-            comment='Another task with progress'
-        )
+        def make_progress_task(steps: int) -> Callable[[TaskExecutable], None]:
+            def task_with_progress(task: TaskExecutable):
+                """Task that reports progress as it executes."""
+                for i in range(steps):
+                    progress = (i + 1) / steps * 100
+                    task.emit_progress(progress)
+                    task.log(f"Progress: {int(progress)}%")
+                    _sleep(0.5)
 
-    def add_task_with_action(self):
-        """Add a task that creates a file and provides actions to open it."""
+            return task_with_progress
 
-        def create_file_task(task: TaskExecutable):
-            content = 'This file was created by TQM Demo.\n\n'
-            content += 'The Queue Task Manager (TQM) is a powerful tool for managing tasks.\n'
-            content += 'You can use it to run multiple tasks in parallel, track their progress,\n'
-            content += 'and manage dependencies between them.'
+        return [
+            TaskBuilder('Progress Task (10 steps)')
+            .with_event(make_progress_task(10), show_progress=True)
+            .with_comment('Task that reports progress')
+            .build(),
+
+            TaskBuilder('Progress Task (5 steps)')
+            .with_event(make_progress_task(5), show_progress=True)
+            .with_comment('Another task with progress')
+            .build(),
+        ]
 
-            with tempfile.NamedTemporaryFile('w', delete=False) as f:
-                f.write(content)
+    def build_task_with_action(self) -> List[TaskUnit]:
+        """Build a task that creates a file and provides actions to open it."""
+
+        def create_file_task(task: TaskExecutable):
+            fd, file_path = tempfile.mkstemp(prefix='tqm_demo_', suffix='.txt')
+            try:
+                os.write(fd, _FILE_CONTENT_BYTES)
+            finally:
+                os.close(fd)
 
             # saved file in internal data
-            task.data['file_path'] = f.name
-            task.log(f"Created file: {f.name}")
-            time.sleep(1)  # Simulate some work
+            task.data['file_path'] = file_path
+            task.log(f"Created file: {file_path}")
+            _sleep(1)  # Simulate some work
 
         def open_file_action(task: TaskExecutable):
             """Action to open the file."""
@@ -103,79 +147,79 @@ class DemoTasks:
             .build()
         )
 
-        self.manager.add_tasks(task)
+        return [task]
 
-    def add_failing_task(self):
-        """Add a task that fails and can be retried."""
-
-        def failing_task(task: TaskExecutable, should_succeed: bool):
-            task.log('This task will intentionally fail')
-            time.sleep(3)
-            if not should_succeed:
-                raise RuntimeError('Task failed intentionally. You can retry it!')
-
-        attempts = count()
+    def build_failing_task(self) -> List[TaskUnit]:
+        """Build a task that fails and can be retried."""
 
         task = (
             TaskBuilder('Failing Task')
-            .with_event(lambda t: failing_task(t, next(attempts) == 1))
+            .with_event(_FailingTask())
             .with_comment(
                 'This task fails intentionally to demonstrate error handling'
             )
             .build()
         )
 
-        self.manager.add_tasks(task)
+        return [task]
 
-    def add_task_group_sequence(self):
-        """Add a group of related tasks."""
+    def build_task_group_sequence(self) -> List[TaskUnit]:
+        """Build a group of related tasks."""
 
-        def task_executor(task: TaskExecutable, delay: float = 1.0):
-            task.log(f"Executing {task.name}")
-            time.sleep(delay)
+        def make_executor(delay: float) -> Callable[[TaskExecutable], None]:
+            def task_executor(task: TaskExecutable):
+                task.log(f"Executing {task.name}")
+                _sleep(delay)
 
-        with self.manager.create_group('Sequence Order Group') as group:
+            return task_executor
 
-            # Create a chain of dependent tasks
-            task1 = (
-                TaskBuilder('Prerequisite Task')
-                .with_event(partial(task_executor, delay=2.0))
-                .with_comment('This task must complete before the next ones can start')
-                .build()
-            )
+        group = TaskGroupBuilder('Sequence Order Group').build()
 
-            task2 = (
-                TaskBuilder('Dependent Task 1')
-                .with_event(partial(task_executor, delay=2.8))
-                .with_wait_for(task1)
-                .with_comment('This task waits for Prerequisite Task to complete')
-                .build()
-            )
+        # Create a chain of dependent tasks
+        task1 = (
+            TaskBuilder('Prerequisite Task')
+            .with_event(make_executor(2.0))
+            .with_comment('This task must complete before the next ones can start')
+            .build()
+        )
 
-            task3 = (
-                TaskBuilder('Dependent Task 2')
-                .with_event(partial(task_executor, delay=2.2))
-                .with_wait_for(task2)
-                .with_comment('This task waits for Dependent Task 1 to complete')
-                .build()
-            )
+        task2 = (
+            TaskBuilder('Dependent Task 1')
+            .with_event(make_executor(2.8))
+            .with_wait_for(task1)
+            .with_comment('This task waits for Prerequisite Task to complete')
+            .build()
+        )
 
-            group.add_tasks(task1, task2, task3)
+        task3 = (
+            TaskBuilder('Dependent Task 2')
+            .with_event(make_executor(2.2))
+            .with_wait_for(task2)
+            .with_comment('This task waits for Dependent Task 1 to complete')
+            .build()
+        )
 
-    def add_random_color_tasks(self):
-        """Add tasks with random colors."""
+        group.add_tasks(task1, task2, task3)
 
-        for i in range(3):
-            task = (
-                TaskBuilder(f"Colored Task {i+1}")
-                .with_event(lambda t: time.sleep(random.uniform(0.5, 1.5)))
-                .with_color()
-                .build()
-            )
-            self.manager.add_tasks(task)
+        return [group]
+
+    def build_random_color_tasks(self) -> List[TaskUnit]:
+        """Build tasks with random colors."""
+
+        return [
+            TaskBuilder(f"Colored Task {i+1}")
+            .with_event(lambda t: _sleep(_uniform(0.5, 1.5)))
+            .with_color()
+            .build()
+            for i in range(3)
+        ]
 
-    def add_task_with_callbacks(self):
-        """Add a task with various lifecycle callbacks."""
+    def build_task_with_callbacks(self) -> List[TaskUnit]:
+        """Build a task with various lifecycle callbacks."""
+
+        def main_task(task: TaskExecutable):
+            task.log('Main task execution')
+            _sleep(2.0)
 
         def on_start(task: TaskExecutable):
             task.log('Task started callback triggered')
@@ -188,7 +232,7 @@ class DemoTasks:
 
         task = (
             TaskBuilder('Callback Demo Task')
-            .with_event(lambda t: (t.log('Main task execution'), time.sleep(2.0)))
+            .with_event(main_task)
             .with_on_start(on_start)
             .with_on_completed(on_completed)
             .with_on_finish(on_finish)
@@ -196,10 +240,27 @@ class DemoTasks:
             .build()
         )
 
-        self.manager.add_tasks(task)
+        return [task]
+
+    def build_complex_group(self) -> List[TaskUnit]:
+        """Build a complex group with nested structures and dependencies."""
+
+        def init_process(task: TaskExecutable):
+            task.log('Initializing process...')
+            _sleep(1.8)
+
+        def make_runner(name: str) -> Callable[[TaskExecutable], None]:
+            message = f"Running {name}..."
 
-    def add_complex_group(self):
-        """Add a complex group with nested structures and dependencies."""
+            def run_parallel(task: TaskExecutable):
+                task.log(message)
+                _sleep(_uniform(0.5, 2.0))
+
+            return run_parallel
+
+        def finalize_process(task: TaskExecutable):
+            task.log('Finalizing process...')
+            _sleep(1.8)
 
         # Create main group
         main_group = (
@@ -212,7 +273,7 @@ class DemoTasks:
         # First sub-task directly in group
         init_task = (
             TaskBuilder('Initialize Process')
-            .with_event(lambda t: (t.log('Initializing process...'), time.sleep(1.8)))
+            .with_event(init_process)
             .with_comment('First step in the complex process')
             .build()
         )
@@ -227,19 +288,18 @@ class DemoTasks:
         )
 
         # Create tasks for parallel execution
-        for i in range(3):
-            task = (
-                TaskBuilder(f"Parallel Task {i+1}")
-                .with_event(lambda t: (t.log(f"Running {t.name}..."), time.sleep(random.uniform(0.5, 2.0))))
-                .with_comment(f"Parallel execution task {i+1}")
-                .build()
-            )
-            parallel_group.add_tasks(task)
+        parallel_group.add_tasks(*[
+            TaskBuilder(f"Parallel Task {i+1}")
+            .with_event(make_runner(f"Parallel Task {i+1}"))
+            .with_comment(f"Parallel execution task {i+1}")
+            .build()
+            for i in range(3)
+        ])
 
         # Final task to finish process
         finish_task = (
             TaskBuilder('Finalize Process')
-            .with_event(lambda t: (t.log('Finalizing process...'), time.sleep(1.8)))
+            .with_event(finalize_process)
             .with_comment('Last step in the complex process')
             .with_wait_for(parallel_group)
             .build()
@@ -248,8 +308,7 @@ class DemoTasks:
         # # Add all tasks to the main group
         main_group.add_tasks(init_task, finish_task)
 
-        # Add groups to manager
-        self.manager.add_tasks(main_group, parallel_group)
+        return [main_group, parallel_group]
 
 
 def setup_manager() -> TQManager:
@@ -265,35 +324,22 @@ def setup_manager() -> TQManager:
     task_manager.setWindowTitle('TQM Demo - Queue Task Manager')
 
     # Set up demo tasks
-    demo_tasks = DemoTasks(task_manager)
-
-    # Add various types of tasks
-    demo_tasks.add_simple_tasks()
-    demo_tasks.add_progress_tasks()
-    demo_tasks.add_task_with_action()
-    demo_tasks.add_failing_task()
-    demo_tasks.add_task_group_sequence()
-    demo_tasks.add_random_color_tasks()
-    demo_tasks.add_task_with_callbacks()
-    demo_tasks.add_complex_group()
-
-    QMessageBox.information(
-        task_manager,
-        'TQM Demo',
-        'Welcome to the TQM Demo!\n\n'
-        'This demo showcases various features of the Queue Task Manager:\n'
-        '• Simple tasks\n'
-        '• Tasks with progress reporting\n'
-        '• File-related tasks with context menu actions\n'
-        '• Task failure and retry\n'
-        '• Task groups\n'
-        '• Task dependencies\n'
-        '• Task colors\n'
-        '• Complex nested groups\n'
-        '• Task lifecycle callbacks\n\n'
-        "Click 'Start Workers' to begin executing the tasks.\n"
-        'You can interact with tasks by right-clicking on them.'
-    )
+    demo_tasks = DemoTasks()
+
+    # Build the various types of tasks and add them in one go
+    all_tasks: List[TaskUnit] = []
+    all_tasks += demo_tasks.build_simple_tasks()
+    all_tasks += demo_tasks.build_progress_tasks()
+    all_tasks += demo_tasks.build_task_with_action()
+    all_tasks += demo_tasks.build_failing_task()
+    all_tasks += demo_tasks.build_task_group_sequence()
+    all_tasks += demo_tasks.build_random_color_tasks()
+    all_tasks += demo_tasks.build_task_with_callbacks()
+    all_tasks += demo_tasks.build_complex_group()
+
+    task_manager.add_tasks(*all_tasks)
+
+    QMessageBox.information(task_manager, 'TQM Demo', _WELCOME_MSG)
 
     # Display the task manager
     return task_manager
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Tuple, Union
+from typing import Union
 
 from PySide2.QtGui import QColor
 from PySide2.QtCore import Qt
 
-RGBA = Tuple[int, int, int, int]
+# builtin generic, cheaper than a typing.Tuple alias. The union stays a typing.Union
+# because the `|` syntax fails at runtime before Python 3.10
+RGBA = tuple[int, int, int, int]
 TASK_COLOR = Union[str, Qt.GlobalColor, RGBA, QColor]
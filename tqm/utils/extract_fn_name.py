@@ -1,8 +1,22 @@
 from __future__ import annotations
 
 from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
 from functools import partial
 
+# weak keys so the cached names go away with their functions
+_NAME_CACHE: WeakKeyDictionary[Callable[..., Any], str] = WeakKeyDictionary()
+
+
+def _get_fn_name(func: Callable[..., Any]) -> str:
+    if isinstance(func, partial):
+        return func.func.__name__
+
+    try:
+        return func.__name__
+    except Exception:
+        return str(func)
+
 
 def extract_fn_name(func: Optional[Callable[..., Any]]) -> str:
     """
@@ -18,10 +32,17 @@ def extract_fn_name(func: Optional[Callable[..., Any]]) -> str:
     if not func:
         return ''
 
-    if isinstance(func, partial):
-        return func.func.__name__
+    try:
+        return _NAME_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+
+    name = _get_fn_name(func)
 
     try:
-        return func.__name__
-    except Exception:
-        return str(func)
+        _NAME_CACHE[func] = name
+    except TypeError:
+        # builtins cannot be weakly referenced and some callables are not hashable
+        pass
+
+    return name
@@ -1,9 +1,41 @@
 from __future__ import annotations
 
 import os
-import shlex
 import platform
 import subprocess
+from typing import Any, Dict, List, Union, Callable
+
+_SYSTEM = platform.system()
+_DEVNULL = subprocess.DEVNULL
+
+
+def _spawn(args: Union[str, List[str]], **kwargs: Any) -> None:
+    """Start the opener without waiting for it, so the UI thread is not blocked."""
+    subprocess.Popen(args, stdin=_DEVNULL, stdout=_DEVNULL, stderr=_DEVNULL, **kwargs)
+
+
+def _open_darwin(file_path: str, reveal: bool) -> None:
+    args = ['open', '-R', file_path] if reveal else ['open', file_path]
+    _spawn(args, start_new_session=True)
+
+
+def _open_windows(file_path: str, reveal: bool) -> None:
+    if reveal:
+        _spawn(f'explorer /select,"{file_path}"', shell=True)
+    else:
+        os.startfile(file_path)
+
+
+def _open_linux(file_path: str, reveal: bool) -> None:
+    args = ['xdg-open', os.path.dirname(file_path) if reveal else file_path]
+    _spawn(args, start_new_session=True)
+
+
+_HANDLERS: Dict[str, Callable[[str, bool], None]] = {
+    'Darwin': _open_darwin,
+    'Windows': _open_windows,
+    'Linux': _open_linux,
+}
 
 
 def open_file(file_path: str, reveal: bool = False) -> None:
@@ -22,21 +54,8 @@ def open_file(file_path: str, reveal: bool = False) -> None:
     if not os.path.exists(file_path):
         return
 
-    if platform.system() == 'Darwin':
-        subprocess.run(
-            shlex.split(f'open -R "{file_path}"' if reveal else f'open "{file_path}"')
-        )
+    handler = _HANDLERS.get(_SYSTEM)
+    if handler is None:
+        raise OSError(f'{_SYSTEM} is not supported.')
 
-    elif platform.system() == 'Windows':
-        if reveal:
-            subprocess.run(f'explorer /select,"{file_path}"', shell=True)
-        else:
-            os.startfile(file_path)
-
-    elif platform.system() == 'Linux':
-        subprocess.run(
-            ['xdg-open', os.path.dirname(file_path) if reveal else file_path]
-        )
-
-    else:
-        raise OSError(f'{platform.system()} is not supported.')
+    handler(file_path, reveal)
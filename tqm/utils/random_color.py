@@ -1,19 +1,22 @@
 
 from __future__ import annotations
 
-from random import randint
-from collections import OrderedDict
+import random
+from collections import deque
 from dataclasses import field, dataclass
 
 from PySide2.QtGui import QColor
 
+_GOLDEN_RATIO = 0.6180339887498949
+
 
 @dataclass
 class RandomColor:
     """
 
-    The class generates a unique random color each time the `generate` method is
-    called. The class stores limited number of colors in the `colors` dictionary.
+    The class generates a unique color each time the `generate` method is called by
+    stepping the hue with the golden ratio, which keeps consecutive colors well apart.
+    The class stores limited number of colors in the `colors` dictionary.
 
     Attributes:
         min_value (int): The minimum value for each color channel (red, green, blue).
@@ -22,7 +25,7 @@ class RandomColor:
         max_colors (int): The maximum number of colors to generate. (Defaults 500)
 
     Methods:
-        generate(): Generates a random color and adds it to the colors dictionary.
+        generate(): Generates the next color and adds it to the colors dictionary.
 
     Examples:
         >>> color = RandomColor().generate()
@@ -38,23 +41,36 @@ class RandomColor:
     alpha: int = 255
     max_colors: int = 500
 
-    colors: OrderedDict[str, QColor] = field(default_factory=OrderedDict[str, QColor], init=False)
+    colors: dict[int, QColor] = field(default_factory=dict[int, QColor], init=False)
     exclude_colors: list[str] = field(default_factory=list[str])
 
+    def __post_init__(self) -> None:
+        # keyed by the packed `QColor.rgb()` value, which skips formatting hex names
+        self._excluded = frozenset(QColor(c).rgb() for c in self.exclude_colors)
+        # random start so separate generators don't repeat the same sequence
+        self._counter = random.randrange(1 << 16)
+        # insertion order of `colors`, oldest first
+        self._order: deque[int] = deque()
+
+        # keep every channel between min_value and max_value
+        self._value = self.max_value / 255
+        self._saturation = 1 - self.min_value / self.max_value if self.max_value else 0.0
+
     def generate(self) -> QColor:
 
         while True:
-            r, g, b = (randint(self.min_value, self.max_value) for _ in range(3))
+            hue = (self._counter * _GOLDEN_RATIO) % 1.0
+            self._counter += 1
 
-            color = QColor(r, g, b, self.alpha)
+            color = QColor.fromHsvF(hue, self._saturation, self._value, self.alpha / 255)
 
-            if color.name() in self.exclude_colors:
+            key = color.rgb()
+            if key in self._excluded or key in self.colors:
                 continue
 
-            if color.name() not in self.colors:
-
-                if len(self.colors) >= self.max_colors:
-                    self.colors.popitem(last=False)
+            if len(self.colors) >= self.max_colors:
+                del self.colors[self._order.popleft()]
 
-                self.colors[color.name()] = color
-                return color
+            self._order.append(key)
+            self.colors[key] = color
+            return color
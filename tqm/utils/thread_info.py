@@ -1,21 +1,26 @@
-
 from __future__ import annotations
 
 import threading
 from pprint import pformat
-from typing import Any, Dict, Union
+from typing import Any, Dict, Union, Optional
 
 from PySide2.QtCore import QThread
 
+# none of the values change during the lifetime of a thread
+_THREAD_CACHE = threading.local()
+
 
 def get_thread_info(pretty: bool = False) -> Union[str, Dict[str, Any]]:
     """Get information about the current thread."""
-    current_thread = threading.current_thread()
-    qt_thread = QThread.currentThread()
-    info: Dict[str, Any] = {
-        'name': current_thread.name,
-        'id': threading.get_ident(),
-        'native_id': current_thread.native_id,
-        'qt_thread_id': qt_thread.currentThread()
-    }
-    return pformat(info) if pretty else info
+    info: Optional[Dict[str, Any]] = getattr(_THREAD_CACHE, 'info', None)
+    if info is None:
+        current_thread = threading.current_thread()
+        info = {
+            'name': current_thread.name,
+            'id': threading.get_ident(),
+            'native_id': current_thread.native_id,
+            'qt_thread_id': int(QThread.currentThreadId())
+        }
+        _THREAD_CACHE.info = info
+
+    return pformat(info) if pretty else dict(info)
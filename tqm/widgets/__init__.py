@@ -1,9 +1,11 @@
 from .frame import Frame
+from .lazy_widget import LazyWidget
 from .help_widget import show_help
 from .tool_button import ToolButton
 
 __all__ = [
     'Frame',
+    'LazyWidget',
     'show_help',
     'ToolButton'
 ]
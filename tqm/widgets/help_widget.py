@@ -4,6 +4,7 @@ import os
 import sysconfig
 from typing import Any, Dict, Optional
 from platform import python_version
+from functools import cache
 
 from PySide2 import __version__ as PySide2_version
 from PySide2.QtGui import QDesktopServices
@@ -35,8 +36,9 @@ class HelpWidget(QDialog):
         extra = extra or {}
         abouts = {**about, **extra}
 
-        for name, value in abouts.items():
-            about_info.appendPlainText(f'- {name.title()}: {value}')
+        about_info.setPlainText(
+            '\n'.join(f'- {name.title()}: {value}' for name, value in abouts.items())
+        )
 
         grid_layout = QGridLayout()
         grid_layout.addWidget(self._button_factory('Issues'), 0, 0, 1, 2)
@@ -67,8 +69,9 @@ class HelpWidget(QDialog):
         QDesktopServices.openUrl(links[link.lower()])
 
 
-def about() -> Dict[str, str]:
-    """Return a dictionary with information about the application."""
+@cache
+def _about() -> Dict[str, str]:
+    # none of the values change during the lifetime of the process
     return {
         'version': __version__,
         'python': python_version(),
@@ -77,6 +80,11 @@ def about() -> Dict[str, str]:
     }
 
 
+def about() -> Dict[str, str]:
+    """Return a dictionary with information about the application."""
+    return dict(_about())
+
+
 def show_help(**kwargs: Any) -> None:
     return HelpWidget(
         git_repo='https://github.com/sisoe24/_TODO_',
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from PySide2.QtGui import QResizeEvent
+from PySide2.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyWidget(QWidget):
+    """Placeholder that creates its widget the first time it gets a visible size.
+
+    Useful for panels that start collapsed in a splitter and might never be opened.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], QWidget],
+        parent: Optional[QWidget] = None
+    ) -> None:
+        super().__init__(parent)
+        self._factory = factory
+        self._widget: Optional[QWidget] = None
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    @property
+    def widget(self) -> Optional[QWidget]:
+        """The created widget, None until the placeholder is shown."""
+        return self._widget
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        super().resizeEvent(event)
+        if self._widget is None and not event.size().isEmpty():
+            self._widget = self._factory()
+            self.layout().addWidget(self._widget)